@@ -0,0 +1,32 @@
+"""Index the search page order so a page is an index range scan.
+
+Every search and list page orders by (email_date DESC NULLS LAST, id DESC) and
+takes limit+1 rows, and the keyset cursor filters on the same pair. Without a
+matching index PostgreSQL sorts every row the filters admit just to throw away
+all but one page of them.
+
+Revision ID: 20260901_16
+Revises: 20260802_15
+"""
+
+from alembic import op
+
+revision = "20260901_16"
+down_revision = "20260802_15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_email_logs_page_order ON email_logs "
+        "(email_date DESC NULLS LAST, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_email_logs_page_order")
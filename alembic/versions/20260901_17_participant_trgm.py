@@ -0,0 +1,39 @@
+"""Trigram indexes for participant substring search.
+
+Participant terms without an @ or a dot fall back to
+ILIKE '%term%' on mail_participants.email and display_name, which is a
+sequential scan over every participant row a tenant can see. With pg_trgm
+installed PostgreSQL answers the same ILIKE from a trigram GIN index, so the
+filter stays a substring match but stops scanning the table.
+
+Revision ID: 20260901_17
+Revises: 20260901_16
+"""
+
+from alembic import op
+
+revision = "20260901_17"
+down_revision = "20260901_16"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_mail_participants_email_trgm "
+        "ON mail_participants USING gin (email gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_mail_participants_display_name_trgm "
+        "ON mail_participants USING gin (display_name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_mail_participants_display_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_mail_participants_email_trgm")
@@ -0,0 +1,33 @@
+"""Index the two foreign keys every hot query filters on.
+
+PostgreSQL does not index foreign keys automatically. Attachment loads filter
+on email_attachments.email_log_id for every search page and forward, and every
+tenant-scoped query joins email_logs through smtp_config_id; without indexes
+both are sequential scans that grow with the mailbox.
+
+Revision ID: 20260901_18
+Revises: 20260901_17
+"""
+
+from alembic import op
+
+revision = "20260901_18"
+down_revision = "20260901_17"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_email_attachments_email_log_id "
+        "ON email_attachments (email_log_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_email_logs_smtp_config_id "
+        "ON email_logs (smtp_config_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_email_logs_smtp_config_id")
+    op.execute("DROP INDEX IF EXISTS ix_email_attachments_email_log_id")
@@ -18,8 +18,10 @@ engine_kwargs = {"echo": settings.database_echo}
 if "postgresql" in settings.database_url:
     engine_kwargs.update(
         {
-            "pool_size": 5,
-            "max_overflow": 10,
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            "pool_recycle": settings.database_pool_recycle,
             "pool_pre_ping": True,
         }
     )
@@ -8,23 +8,26 @@ def sanitize_db_text(value: str | None) -> str:
     return (value or "").replace("\x00", "")
 
 
+# Compiled once: sanitize_filename runs per attachment, and the invalid-char
+# pass used to be ~30 separate str.replace scans over the whole name.
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]+")
+_INVALID_FILENAME_CHARS_RE = re.compile("[" + re.escape('<>:"/\\|?*[](){}!@#$%^&+=`~;,\'') + "]")
+_UNDERSCORE_RUNS_RE = re.compile(r"_{2,}")
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters, spaces, and encoding issues."""
     if not filename:
         return "unknown"
 
     filename = sanitize_db_text(filename)
-    filename = re.sub(r"[\x00-\x1f\x7f]+", "_", filename)
+    filename = _CONTROL_CHARS_RE.sub("_", filename)
     filename = filename.replace("=_utf-8_B_", "").replace("=_utf-8_Q_", "")
     filename = filename.replace("_utf-8_", "").replace("=C3=A4", "ae").replace("=C3=BC", "ue")
     filename = filename.replace("=C3=B6", "oe").replace("=C3=9F", "ss")
     filename = filename.replace(" ", "_")
-
-    invalid_chars = '<>:"/\\|?*[](){}!@#$%^&+=`~;,\'"'
-    for char in invalid_chars:
-        filename = filename.replace(char, "")
-
-    filename = re.sub(r"_{2,}", "_", filename)
+    filename = _INVALID_FILENAME_CHARS_RE.sub("", filename)
+    filename = _UNDERSCORE_RUNS_RE.sub("_", filename)
     filename = filename.strip("_.")
 
     if not filename:
@@ -52,16 +52,20 @@ class AttachmentHandler:
             logger.error("Error extracting attachments for email %s: %s", email_log_id, e)
             return []
 
+    _ATTACHMENT_TYPE_PREFIXES = ("image/", "audio/", "video/", "application/")
+
     def _is_attachment(self, part) -> bool:
-        """Check if email part is an attachment."""
-        filename = part.get_filename()
-        content_disposition = part.get("Content-Disposition", "")
-        content_type = part.get_content_type()
+        """Check if email part is an attachment.
 
-        if filename or "attachment" in content_disposition:
+        Ordered cheapest-first and short-circuiting: most parts that are
+        attachments carry a filename, so the disposition header and
+        content-type are only pulled when the earlier checks fail.
+        """
+        if part.get_filename():
             return True
-
-        return content_type.startswith(("image/", "audio/", "video/", "application/"))
+        if "attachment" in (part.get("Content-Disposition", "") or ""):
+            return True
+        return part.get_content_type().startswith(self._ATTACHMENT_TYPE_PREFIXES)
 
     async def _process_attachment(
         self,
@@ -106,16 +110,26 @@ class AttachmentHandler:
                 extractor_version="2",
             )
 
-            if size > storage_config.max_attachment_size:
+            from src.storage_config.resolver import should_store_attachment
+
+            verdict = should_store_attachment(
+                storage_config, detected_content_type or claimed_content_type, size
+            )
+            if verdict == "skip":
                 attachment.extraction_state = "skipped_size"
                 logger.info("Skipped extraction for oversized attachment %s (%s bytes)", filename, size)
                 return attachment
+            if verdict == "binary":
+                # No enabled extractor covers this type; keep the metadata row
+                # without spinning up the extractor at all.
+                attachment.extraction_state = "skipped"
+                logger.debug("No text extracted for %s (type: %s)", filename, claimed_content_type)
+                return attachment
 
             # Extract text directly from in-memory payload and store in DB column
-            from src.email.text_extractor import TextExtractor
+            from src.email.text_extractor import default_extractor
 
-            text_extractor = TextExtractor()
-            text_content = await text_extractor.extract(
+            text_content = await default_extractor.extract(
                 payload, detected_content_type or claimed_content_type, storage_config
             )
 
@@ -14,7 +14,7 @@ from src.email import sanitize_db_text
 from src.email.gmail_api_client import GmailApiClient, GmailHistoryExpired
 from src.email.message_flags import apply_flag_state, normalize_flags
 from src.email.smtp_client import SMTPClient
-from src.email.text_extractor import TextExtractor
+from src.email.text_extractor import default_extractor
 from src.models.email import EmailLog
 from src.models.participant import MailParticipant
 from src.models.placement import MessagePlacement
@@ -922,7 +922,6 @@ class EmailProcessor:
         from src.email.attachment_handler import AttachmentHandler
         from src.storage_config.resolver import resolve_storage_config
 
-        text_extractor = TextExtractor()
         attachment_handler = AttachmentHandler()
 
         for email_data in emails:
@@ -1036,7 +1035,7 @@ class EmailProcessor:
                     body_plain = sanitize_db_text(email_data.get("body_plain", ""))
                     body_html = sanitize_db_text(email_data.get("body_html", ""))
                     if not body_plain and body_html:
-                        body_plain = text_extractor._extract_html(body_html.encode("utf-8", errors="replace")) or ""
+                        body_plain = default_extractor._extract_html(body_html.encode("utf-8", errors="replace")) or ""
 
                     email_log = EmailLog(
                         smtp_config_id=email_data["smtp_config_id"],
@@ -1088,9 +1087,7 @@ class EmailProcessor:
                         attachments = await attachment_handler.extract_attachments(
                             email_data["raw_email"], email_log.id, storage_config
                         )
-                        for attachment in attachments:
-                            db.add(attachment)
-
+                        db.add_all(attachments)
                         email_log.attachment_count = len(attachments)
 
                 logger.info(
@@ -180,8 +180,11 @@ class SMTPClient:
         return await self.connect()
 
     # Raw RFC822 messages can be large and remain referenced while the caller
-    # commits a yielded batch. Keep only one message in flight per mailbox.
-    BATCH_SIZE = 1
+    # commits a yielded batch, so batches are bounded by bytes as well as by
+    # count: many small messages amortise the caller's per-batch cursor and
+    # stats writes, while a single large message still travels alone.
+    BATCH_SIZE = 25
+    BATCH_MAX_BYTES = 8 * 1024 * 1024
     METADATA_BATCH_SIZE = 200
 
     async def fetch_new_emails(self, limit: Optional[int] = None, since: Optional[datetime] = None):
@@ -386,6 +389,7 @@ class SMTPClient:
         from src.config import settings
 
         batch = []
+        batch_bytes = 0
         highest_uid = last_uid
         for i, msg_id in enumerate(message_ids):
             try:
@@ -437,6 +441,7 @@ class SMTPClient:
                                 settings.imap_max_message_size,
                             )
                         batch.append(email_data)
+                        batch_bytes += email_data["provider_size"] or 0
                     if message_uid is not None:
                         highest_uid = max(highest_uid or 0, message_uid)
                 else:
@@ -455,10 +460,11 @@ class SMTPClient:
                 raise
 
             # Yield batch when full
-            if len(batch) >= self.BATCH_SIZE:
+            if len(batch) >= self.BATCH_SIZE or batch_bytes >= self.BATCH_MAX_BYTES:
                 logger.info("Progress: %s/%s fetched from %s in %s", i + 1, total, folder, self.config.name)
                 yield batch
                 batch = []
+                batch_bytes = 0
 
         # Yield remaining
         if batch:
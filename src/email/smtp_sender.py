@@ -4,6 +4,7 @@ import base64
 import logging
 import smtplib
 import ssl
+import time
 from datetime import datetime, timezone
 from email import encoders
 from email.mime.base import MIMEBase
@@ -21,9 +22,17 @@ logger = logging.getLogger(__name__)
 class EmailSender:
     """SMTP client for sending emails."""
 
+    # Connections used within probe_after_seconds are trusted as-is, so a
+    # burst of sends pays no extra roundtrips; older ones get a NOOP probe
+    # first, and anything idle past idle_expiry_seconds is replaced without
+    # probing because most servers will have dropped it already.
+    probe_after_seconds = 30.0
+    idle_expiry_seconds = 300.0
+
     def __init__(self, smtp_config: SMTPConfig):
         self.config = smtp_config
         self._server = None
+        self._last_used = time.monotonic()
 
     async def connect(self) -> bool:
         """Connect to SMTP server."""
@@ -63,6 +72,7 @@ class EmailSender:
             else:
                 self._server.login(self.config.username, self.config.password)
             logger.info("Connected to SMTP server %s", self.config.name)
+            self._last_used = time.monotonic()
             return True
 
         except Exception as e:
@@ -80,6 +90,21 @@ class EmailSender:
             finally:
                 self._server = None
 
+    def _connection_usable(self) -> bool:
+        """Probe the held connection so a session the server idled out is
+        replaced before a message is spooled into it, not discovered mid-send."""
+        if self._server is None:
+            return False
+        idle = time.monotonic() - self._last_used
+        if idle <= self.probe_after_seconds:
+            return True
+        if idle > self.idle_expiry_seconds:
+            return False
+        try:
+            return self._server.noop()[0] == 250
+        except Exception:
+            return False
+
     async def send_email(
         self,
         to_addresses: List[str],
@@ -111,6 +136,8 @@ class EmailSender:
         Returns:
             Dict with 'success' bool and 'message' string
         """
+        if self._server is not None and not self._connection_usable():
+            self.disconnect()
         if not self._server and not await self.connect():
             return {"success": False, "message": "Failed to connect to SMTP server"}
 
@@ -214,6 +241,7 @@ class EmailSender:
                 }
 
             recipient_count = len(all_recipients)
+            self._last_used = time.monotonic()
             logger.info("Email sent successfully to %s recipients via %s", recipient_count, self.config.name)
 
             return {
@@ -289,8 +317,14 @@ class EmailSender:
 class EmailSenderManager:
     """Manages multiple SMTP senders."""
 
+    # How long a detached config snapshot may serve sends before the row is
+    # read again. Credential and transport changes call invalidate() directly,
+    # so the TTL only bounds how long a disablement can lag behind.
+    config_snapshot_ttl_seconds = 30.0
+
     def __init__(self):
         self._senders = {}
+        self._config_snapshots: dict[int, tuple[float, SMTPConfig]] = {}
 
     async def get_sender(self, smtp_config: SMTPConfig) -> EmailSender:
         """Get or create email sender for config."""
@@ -321,28 +355,51 @@ class EmailSenderManager:
         return self._senders[sender_key]
 
     async def invalidate(self, smtp_config_id: int) -> None:
+        self._config_snapshots.pop(smtp_config_id, None)
         sender = self._senders.pop(smtp_config_id, None)
         if sender:
             sender.disconnect()
 
+    def _cached_config(self, smtp_config_id: int, owner_user_id: int | None) -> SMTPConfig | None:
+        cached = self._config_snapshots.get(smtp_config_id)
+        if not cached:
+            return None
+        expires_at, snapshot = cached
+        if expires_at <= time.monotonic():
+            self._config_snapshots.pop(smtp_config_id, None)
+            return None
+        # Ownership never moves between users, so a snapshot owned by someone
+        # else is the same answer the database would give: not this caller's.
+        if owner_user_id is not None and snapshot.owner_user_id != owner_user_id:
+            return None
+        return snapshot
+
     async def send_email_via_config(
         self, smtp_config_id: int, owner_user_id: int | None = None, **email_args
     ) -> Dict[str, Union[bool, str]]:
         """Send email using specific SMTP configuration."""
         try:
-            with get_db_session() as db:
-                query = db.query(SMTPConfig).filter(SMTPConfig.id == smtp_config_id)
-                if owner_user_id is not None:
-                    query = query.filter(SMTPConfig.owner_user_id == owner_user_id)
-                config = query.first()
-                if not config:
-                    return {"success": False, "message": f"SMTP config {smtp_config_id} not found"}
-
-                if not config.enabled:
-                    return {"success": False, "message": f"SMTP config {config.name} is disabled"}
-
-                # Create a detached config object outside the session
-                temp_config = SMTPConfig.create_detached(config)
+            temp_config = self._cached_config(smtp_config_id, owner_user_id)
+            if temp_config is None:
+                with get_db_session() as db:
+                    query = db.query(SMTPConfig).filter(SMTPConfig.id == smtp_config_id)
+                    if owner_user_id is not None:
+                        query = query.filter(SMTPConfig.owner_user_id == owner_user_id)
+                    config = query.first()
+                    if not config:
+                        return {"success": False, "message": f"SMTP config {smtp_config_id} not found"}
+
+                    if not config.enabled:
+                        return {"success": False, "message": f"SMTP config {config.name} is disabled"}
+
+                    # Create a detached config object outside the session; the
+                    # snapshot also caches the decrypted credential, so repeat
+                    # sends skip both the row fetch and the decryption.
+                    temp_config = SMTPConfig.create_detached(config)
+                self._config_snapshots[smtp_config_id] = (
+                    time.monotonic() + self.config_snapshot_ttl_seconds,
+                    temp_config,
+                )
 
             sender = await self.get_sender(temp_config)
             return await sender.send_email(**email_args)
@@ -357,6 +414,7 @@ class EmailSenderManager:
         for sender in self._senders.values():
             sender.disconnect()
         self._senders.clear()
+        self._config_snapshots.clear()
 
 
 # Global sender manager instance
@@ -7,6 +7,8 @@ import multiprocessing
 import resource
 from typing import TYPE_CHECKING, Optional
 
+from src.config import settings
+
 if TYPE_CHECKING:
     from src.storage_config.resolver import StorageConfig
 
@@ -21,7 +23,7 @@ def _limit_worker() -> None:
 
 
 _EXTRACTION_POOL = concurrent.futures.ProcessPoolExecutor(
-    max_workers=1,
+    max_workers=max(1, settings.extraction_workers),
     initializer=_limit_worker,
     mp_context=multiprocessing.get_context("spawn"),
     max_tasks_per_child=25,
@@ -29,7 +31,7 @@ _EXTRACTION_POOL = concurrent.futures.ProcessPoolExecutor(
 
 
 def _extract_in_worker(data: bytes, content_type: str, config: "StorageConfig") -> str | None:
-    return TextExtractor()._extract_sync(data, content_type, config)
+    return default_extractor._extract_sync(data, content_type, config)
 
 
 class TextExtractor:
@@ -104,6 +106,17 @@ class TextExtractor:
 
     def _extract_html(self, data: bytes) -> str:
         """Extract text from HTML."""
+        # selectolax wraps the Lexbor C parser; on the large marketing emails
+        # that dominate this path it extracts text an order of magnitude
+        # faster than html.parser building a Python tree.
+        try:
+            from selectolax.parser import HTMLParser
+
+            root = HTMLParser(data).root
+            if root is not None:
+                return root.text(separator=" ", strip=True)
+        except Exception as e:
+            logger.warning("HTML extraction via selectolax failed, falling back: %s", e)
         try:
             from bs4 import BeautifulSoup
 
@@ -292,3 +305,8 @@ class TextExtractor:
         except Exception as e:
             logger.warning("OCR extraction failed: %s", e)
             return ""
+
+
+# The extractor is stateless (lazy imports, class-level OCR language cache),
+# so callers share one instance instead of constructing per attachment.
+default_extractor = TextExtractor()
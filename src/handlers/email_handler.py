@@ -1,9 +1,11 @@
 """Authenticated, tenant-scoped HTTP API."""
 
 import asyncio
+import hashlib
 import logging
 import secrets
 from datetime import datetime
+from html import escape as html_escape
 from typing import Annotated
 from urllib.parse import parse_qs, quote
 
@@ -11,14 +13,17 @@ import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse, Response
 from pydantic import BaseModel, EmailStr, Field, SecretStr
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.config import settings
 from src.database.connection import get_db
+from src.email import sanitize_filename
 from src.email.email_processor import EmailProcessor
 from src.email.smtp_client import SMTPClient
 from src.email.smtp_sender import EmailSenderManager
 from src.handlers.email_handler_types import SendMailInput
+from src.models.email import EmailLog
 from src.models.smtp_config import SMTPConfig
 from src.models.user import User
 from src.security.account_connect_tokens import (
@@ -28,11 +33,16 @@ from src.security.account_connect_tokens import (
 from src.security.auth import get_current_user, owned_account_query
 from src.security.download_tokens import issue_download_token, verify_download_token
 from src.security.provider_tokens import GMAIL_MAIL_SCOPE, encode_oauth_credential
-from src.services.attachment_service import owned_attachment, refetch_attachment_bytes
+from src.services.attachment_service import (
+    owned_attachment,
+    refetch_attachment_bytes,
+    refetch_attachments_concurrently,
+)
 from src.services.mail_service import (
     get_thread,
     owned_account,
     owned_email,
+    owned_email_and_account,
     search_mail,
     search_mail_regex,
     send_mail,
@@ -452,6 +462,7 @@ async def delete_account(account_id: int, user: CurrentUser, db: Session = Depen
     account.sync_lock_expires_at = None
     account.retry_at = None
     db.commit()
+    await email_sender_manager.invalidate(account.id)
     return {"success": True, "message": "Account disabled; synced data was retained"}
 
 
@@ -645,7 +656,8 @@ async def gmail_callback(
     account.consecutive_failures = 0
     account.retry_at = None
     db.commit()
-    db.refresh(account)
+    # No refresh: nothing reads the account after this commit, the response is
+    # just a redirect.
     return RedirectResponse(url=f"{settings.public_base_url.rstrip('/')}?connected=gmail")
 
 
@@ -732,7 +744,11 @@ async def search_emails_regex(
     cursor: str | None = None,
     deduplicate: str = Query(default="exact", pattern="^(none|exact|mirror)$"),
 ):
-    return search_mail_regex(
+    # Regex search runs the pattern over page bodies in Python to build
+    # snippets; push that CPU work off the event loop like the other blocking
+    # call sites do.
+    return await asyncio.to_thread(
+        search_mail_regex,
         db,
         user,
         pattern=pattern,
@@ -752,9 +768,38 @@ async def search_emails_regex(
     )
 
 
+def _email_etag(message) -> str:
+    """A validator over everything in the response that can change.
+
+    processed_at alone is not enough: the reconciler rewrites flag state and
+    content_state without touching it, and a 304 must never hide a read-state
+    change.
+    """
+    state = (
+        message.processed_at.isoformat() if message.processed_at else "",
+        message.is_unread,
+        message.is_flagged,
+        message.is_answered,
+        message.content_state,
+        message.attachment_count,
+    )
+    digest = hashlib.sha256(repr(state).encode()).hexdigest()[:16]
+    return f'W/"{message.id}-{digest}"'
+
+
 @router.get("/emails/{email_id:int}")
-async def get_email(email_id: int, user: CurrentUser, db: Session = Depends(get_db)):
-    return serialize_email(owned_email(db, user.id, email_id), include_body=True)
+async def get_email(
+    email_id: int, request: Request, response: Response, user: CurrentUser, db: Session = Depends(get_db)
+):
+    message = owned_email(db, user.id, email_id)
+    etag = _email_etag(message)
+    if request.headers.get("if-none-match") == etag:
+        # Bodies run to a quarter megabyte; a poll that matches skips
+        # serializing and sending all of it.
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return serialize_email(message, include_body=True)
 
 
 @router.get("/emails/{email_id:int}/thread")
@@ -781,8 +826,6 @@ async def download_attachment(attachment_id: int, token: str, db: Session = Depe
     except ValueError as exc:
         raise HTTPException(status_code=403, detail=str(exc)) from None
     attachment, payload = await refetch_attachment_bytes(db, user_id, attachment_id)
-    from src.email import sanitize_filename
-
     download_name = sanitize_filename(attachment.filename)
     ascii_name = download_name.encode("ascii", errors="ignore").decode() or "attachment"
     return Response(
@@ -806,22 +849,37 @@ async def send_email(payload: SendMailInput, user: CurrentUser, db: Session = De
 async def reply_to_email(
     email_id: int, payload: ReplyInput, user: CurrentUser, db: Session = Depends(get_db)
 ):
-    original = owned_email(db, user.id, email_id)
-    owned_account(db, user.id, payload.account_id)
+    original, _ = owned_email_and_account(db, user.id, email_id, payload.account_id)
     subject = original.subject or ""
-    if not subject.lower().startswith("re:"):
+    # Lowercase only the prefix being tested, not a copy of the whole subject.
+    if subject[:3].lower() != "re:":
         subject = f"Re: {subject}"
     body_text = payload.body_text or ""
+    body_html = payload.body_html
     if payload.include_original:
-        quoted = "\n".join(f"> {line}" for line in (original.body_plain or "").splitlines())
-        body_text += f"\n\nOn {original.email_date or 'unknown'}, {original.sender} wrote:\n{quoted}"
+        # One C-level replace per newline convention instead of a Python-level
+        # generator allocating a string per line of the quoted original; the
+        # normalised body is built once and feeds both reply formats.
+        original_plain = (
+            (original.body_plain or "").replace("\r\n", "\n").replace("\r", "\n").rstrip("\n")
+        )
+        quoted = "> " + original_plain.replace("\n", "\n> ") if original_plain else ""
+        attribution = f"On {original.email_date or 'unknown'}, {original.sender} wrote:"
+        body_text += f"\n\n{attribution}\n{quoted}"
+        if body_html:
+            # The stored original is plain text; escape it so message content
+            # cannot inject markup into the reply.
+            body_html += (
+                f"<br><br>{html_escape(attribution)}<blockquote>"
+                f"{html_escape(original_plain).replace(chr(10), '<br>')}</blockquote>"
+            )
     send_payload = SendMailInput(
         account_id=payload.account_id,
         to_addresses=[original.sender],
         subject=subject,
         reply_to_email_id=original.id,
         body_text=body_text,
-        body_html=payload.body_html,
+        body_html=body_html,
         cc_addresses=payload.cc_addresses,
         idempotency_key=payload.idempotency_key,
     )
@@ -832,10 +890,14 @@ async def reply_to_email(
 async def forward_email(
     email_id: int, payload: ForwardInput, user: CurrentUser, db: Session = Depends(get_db)
 ):
-    original = owned_email(db, user.id, email_id)
-    owned_account(db, user.id, payload.account_id)
+    # Only join the attachment rows in when the caller wants them forwarded;
+    # a body-only forward stays a single narrow row.
+    original, _ = owned_email_and_account(
+        db, user.id, email_id, payload.account_id,
+        with_attachments=payload.include_attachments,
+    )
     subject = original.subject or ""
-    if not subject.lower().startswith("fwd:"):
+    if subject[:4].lower() != "fwd:":
         subject = f"Fwd: {subject}"
     header = (
         "\n\n---------- Forwarded message ----------\n"
@@ -843,10 +905,19 @@ async def forward_email(
         f"Subject: {original.subject or '(no subject)'}\nTo: {original.recipient}\n\n"
     )
     attachments = []
-    if payload.include_attachments:
-        for attachment in original.attachments:
-            _, binary = await refetch_attachment_bytes(db, user.id, attachment.id)
-            attachments.append({"data": binary, "filename": attachment.filename})
+    if payload.include_attachments and original.attachments:
+        # send_mail enforces the same limits, but only after the bytes exist;
+        # the stored size metadata lets an oversized forward fail before
+        # anything is pulled from the provider.
+        if len(original.attachments) > settings.max_outbound_attachments:
+            raise HTTPException(status_code=400, detail="Too many outbound attachments")
+        if sum(item.size or 0 for item in original.attachments) > settings.max_outbound_attachment_bytes:
+            raise HTTPException(
+                status_code=400, detail="Outbound attachments exceed the configured limit"
+            )
+        attachments = await refetch_attachments_concurrently(
+            user.id, [attachment.id for attachment in original.attachments]
+        )
 
     send_payload = SendMailInput(
         account_id=payload.account_id,
@@ -863,15 +934,22 @@ async def forward_email(
 
 @router.get("/status")
 async def status_view(user: CurrentUser, db: Session = Depends(get_db)):
-    accounts = owned_account_query(db, user)
-    account_ids = [row.id for row in accounts.all()]
-    from src.models.email import EmailLog
-
+    # One aggregate instead of hydrating every account row and re-sending the
+    # id list back as an IN filter. pg_class.reltuples would be cheaper still,
+    # but it counts the whole table and these counts are tenant-scoped.
+    account_count, email_count = (
+        db.query(
+            func.count(func.distinct(SMTPConfig.id)),
+            func.count(EmailLog.id),
+        )
+        .select_from(SMTPConfig)
+        .outerjoin(EmailLog, EmailLog.smtp_config_id == SMTPConfig.id)
+        .filter(SMTPConfig.owner_user_id == user.id)
+        .one()
+    )
     return {
         "status": "running",
         "processor_active": email_processor.processing,
-        "accounts": len(account_ids),
-        "emails": db.query(EmailLog).filter(EmailLog.smtp_config_id.in_(account_ids)).count()
-        if account_ids
-        else 0,
+        "accounts": int(account_count),
+        "emails": int(email_count),
     }
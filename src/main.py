@@ -1,21 +1,37 @@
 """Main entry point for Email Server."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import uvicorn
 
 from src.config import settings
 
-# Configure logging
+# Configure logging. Records are enqueued on the calling thread and written by
+# a listener thread, so a slow disk or blocked stdout never stalls the event
+# loop just to emit a log line.
+_log_sinks = [logging.StreamHandler()]
+if settings.log_file:
+    _log_sinks.append(logging.FileHandler(settings.log_file))
+_log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+for _sink in _log_sinks:
+    _sink.setFormatter(_log_formatter)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(settings.log_file) if settings.log_file else logging.NullHandler(),
-    ],
+    # The queue handler must not pre-format: the sinks apply the real format,
+    # and a default here would wrap the message twice.
+    format="%(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, *_log_sinks, respect_handler_level=True)
+_log_listener.start()
+# Drain the queue and flush the sinks at interpreter exit; the listener thread
+# is a daemon, so without this the final shutdown/fatal-error lines can vanish.
+atexit.register(_log_listener.stop)
 
 # OAuth providers can otherwise log bearer tokens embedded in token-info URLs.
 for logger_name in ("httpx", "httpcore"):
@@ -38,6 +54,11 @@ def run_server():
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        # uvicorn[standard] ships both; pin them rather than trusting "auto"
+        # detection, so a partial install degrades loudly instead of silently
+        # falling back to asyncio + h11.
+        loop="uvloop",
+        http="httptools",
         log_level=settings.log_level.lower(),
         access_log=False,
     )
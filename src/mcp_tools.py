@@ -1,5 +1,6 @@
 """Small, deliberate MCP tool surface."""
 
+import asyncio
 from datetime import datetime
 from typing import Literal
 
@@ -24,7 +25,7 @@ from src.security.download_tokens import issue_download_token
 from src.security.mcp_errors import mcp_error_boundary
 from src.services.attachment_service import (
     owned_attachment,
-    refetch_attachment_bytes,
+    refetch_attachments_concurrently,
 )
 from src.services.mail_service import (
     MailAccountSummary,
@@ -650,7 +651,8 @@ def register_mcp_tools(mcp) -> None:
     ) -> dict:
         user = await current_mcp_user()
         with SessionLocal() as db:
-            return regex_search(
+            return await asyncio.to_thread(
+                regex_search,
                 db,
                 user,
                 pattern=pattern,
@@ -786,19 +788,11 @@ def register_mcp_tools(mcp) -> None:
                     status_code=400,
                     detail="Too many outbound attachments",
                 )
-            attachments = []
-            for attachment_id in selected_ids:
-                attachment, binary = await refetch_attachment_bytes(
-                    db,
-                    user.id,
-                    attachment_id,
-                )
-                attachments.append(
-                    {
-                        "data": binary,
-                        "filename": attachment.filename,
-                    }
-                )
+            attachments = (
+                await refetch_attachments_concurrently(user.id, selected_ids)
+                if selected_ids
+                else []
+            )
             return await send_message(
                 db,
                 user,
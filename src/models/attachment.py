@@ -1,7 +1,7 @@
 """Email attachment metadata and extracted text."""
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -13,7 +13,7 @@ class EmailAttachment(Base):
     __tablename__ = "email_attachments"
 
     id = Column(Integer, primary_key=True)
-    email_log_id = Column(Integer, ForeignKey("email_logs.id"), nullable=False)
+    email_log_id = Column(Integer, ForeignKey("email_logs.id"), nullable=False, index=True)
 
     filename = Column(String(500), nullable=False)
     content_type = Column(String(100), nullable=True)
@@ -25,7 +25,10 @@ class EmailAttachment(Base):
     size = Column(Integer, default=0)
     sha256 = Column(String(64), nullable=True)
 
-    text_content = Column(Text, nullable=True)  # Extracted text stored directly in DB
+    # Extracted text stored directly in DB. Deferred: most loads (search page
+    # eager loads, counts, forwarding metadata) only need the narrow columns,
+    # and this one can be a quarter megabyte per row.
+    text_content = deferred(Column(Text, nullable=True))
     extraction_state = Column(String(32), nullable=False, default="pending")
     extraction_error = Column(Text, nullable=True)
     extractor_version = Column(String(32), nullable=True)
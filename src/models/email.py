@@ -29,7 +29,7 @@ class EmailLog(Base):
     )
 
     id = Column(Integer, primary_key=True)
-    smtp_config_id = Column(Integer, ForeignKey("smtp_configs.id"), nullable=False)
+    smtp_config_id = Column(Integer, ForeignKey("smtp_configs.id"), nullable=False, index=True)
 
     sender = Column(String(500), nullable=False)
     recipient = Column(String(500), nullable=False)
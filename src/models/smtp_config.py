@@ -1,5 +1,8 @@
 """Mail account configuration model."""
 
+from dataclasses import dataclass
+from datetime import datetime
+
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -7,6 +10,64 @@ from sqlalchemy.sql import func
 from .base import Base
 
 
+@dataclass(slots=True)
+class DetachedMailAccount:
+    """Plain snapshot of an SMTPConfig for use outside a session.
+
+    Slotted so the per-sync copies stay compact and attribute reads are
+    offset loads instead of dict lookups; the decrypted password travels
+    with the snapshot so connection code never touches the session.
+    """
+
+    id: int
+    owner_user_id: int
+    provider: str
+    auth_type: str
+    name: str
+    account_name: str | None
+    host: str
+    port: int
+    smtp_host: str | None
+    smtp_port: int
+    username: str
+    credential_ciphertext: str | None
+    imap_use_ssl: bool
+    imap_use_tls: bool
+    smtp_use_ssl: bool
+    smtp_use_tls: bool
+    enabled: bool
+    sync_state: str
+    backfill_complete: bool
+    backfill_processed: int
+    backfill_total: int | None
+    last_attempt_at: datetime | None
+    last_success_at: datetime | None
+    last_reconciled_at: datetime | None
+    last_error_code: str | None
+    last_error_message: str | None
+    consecutive_failures: int
+    retry_at: datetime | None
+    provider_sync_token: str | None
+    sync_page_token: str | None
+    initial_sync_complete: bool
+    sync_generation: int
+    store_text_only_override: bool | None
+    max_attachment_size_override: int | None
+    extract_pdf_text_override: bool | None
+    extract_docx_text_override: bool | None
+    extract_image_text_override: bool | None
+    extract_other_text_override: bool | None
+    password: str
+    sync_cursors: dict
+
+
+_DETACHED_COLUMNS = tuple(
+    name
+    for name in DetachedMailAccount.__dataclass_fields__
+    if name not in ("password", "sync_cursors")
+)
+
+
 class SMTPConfig(Base):
     """An IMAP/SMTP mailbox owned by one application user."""
 
@@ -133,58 +194,17 @@ class SMTPConfig(Base):
         }
 
     @staticmethod
-    def create_detached(config: "SMTPConfig") -> "SMTPConfig":
+    def create_detached(config: "SMTPConfig") -> DetachedMailAccount:
         """Create a detached copy of the config for use outside SQLAlchemy session."""
-
-        class DetachedConfig:
-            pass
-
-        detached = DetachedConfig()
-        detached.id = config.id
-        detached.owner_user_id = config.owner_user_id
-        detached.provider = config.provider
-        detached.auth_type = config.auth_type
-        detached.name = config.name
-        detached.account_name = config.account_name
-        detached.host = config.host
-        detached.port = config.port
-        detached.smtp_host = config.smtp_host
-        detached.smtp_port = config.smtp_port
-        detached.username = config.username
-        detached.credential_ciphertext = config.credential_ciphertext
-        detached.password = config.password if config.auth_type == "password" else ""
-        detached.imap_use_ssl = config.imap_use_ssl
-        detached.imap_use_tls = config.imap_use_tls
-        detached.smtp_use_ssl = config.smtp_use_ssl
-        detached.smtp_use_tls = config.smtp_use_tls
-        detached.enabled = config.enabled
-        detached.sync_state = config.sync_state
-        detached.backfill_complete = config.backfill_complete
-        detached.backfill_processed = config.backfill_processed
-        detached.backfill_total = config.backfill_total
-        detached.last_attempt_at = config.last_attempt_at
-        detached.last_success_at = config.last_success_at
-        detached.last_reconciled_at = config.last_reconciled_at
-        detached.last_error_code = config.last_error_code
-        detached.last_error_message = config.last_error_message
-        detached.consecutive_failures = config.consecutive_failures
-        detached.retry_at = config.retry_at
-        detached.provider_sync_token = config.provider_sync_token
-        detached.sync_page_token = config.sync_page_token
-        detached.initial_sync_complete = config.initial_sync_complete
-        detached.sync_generation = config.sync_generation
-        detached.store_text_only_override = config.store_text_only_override
-        detached.max_attachment_size_override = config.max_attachment_size_override
-        detached.extract_pdf_text_override = config.extract_pdf_text_override
-        detached.extract_docx_text_override = config.extract_docx_text_override
-        detached.extract_image_text_override = config.extract_image_text_override
-        detached.extract_other_text_override = config.extract_other_text_override
-        detached.sync_cursors = {
-            cursor.folder: {
-                "uid_validity": cursor.uid_validity,
-                "last_uid": cursor.last_uid,
-                "backfill_complete": cursor.backfill_complete,
-            }
-            for cursor in config.sync_cursors
-        }
-        return detached
+        return DetachedMailAccount(
+            password=config.password if config.auth_type == "password" else "",
+            sync_cursors={
+                cursor.folder: {
+                    "uid_validity": cursor.uid_validity,
+                    "last_uid": cursor.last_uid,
+                    "backfill_complete": cursor.backfill_complete,
+                }
+                for cursor in config.sync_cursors
+            },
+            **{name: getattr(config, name) for name in _DETACHED_COLUMNS},
+        )
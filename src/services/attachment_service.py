@@ -1,11 +1,13 @@
 """Owner-checked ephemeral attachment retrieval."""
 
+import asyncio
 import hashlib
 from email import message_from_bytes, policy
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from src.database.connection import get_db_session
 from src.email.attachment_handler import AttachmentHandler
 from src.email.gmail_api_client import GmailApiClient
 from src.email.smtp_client import SMTPClient
@@ -118,3 +120,26 @@ async def refetch_attachment_bytes(
         attachment.size = len(payload)
         db.commit()
     return attachment, payload
+
+
+async def refetch_attachments_concurrently(
+    user_id: int, attachment_ids: list[int], *, concurrency: int = 4
+) -> list[dict]:
+    """Refetch several attachments with their provider round-trips overlapped.
+
+    Each refetch opens its own IMAP or Gmail connection, so fetching them one
+    after another pays the sum of the latencies. Every task gets a session of
+    its own, because one Session must never be shared between concurrent tasks.
+    Results keep the order of ``attachment_ids`` and are shaped for the sender.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(attachment_id: int) -> dict:
+        async with semaphore:
+            with get_db_session() as task_db:
+                attachment, payload = await refetch_attachment_bytes(
+                    task_db, user_id, attachment_id
+                )
+                return {"data": payload, "filename": attachment.filename}
+
+    return list(await asyncio.gather(*(load(item) for item in attachment_ids)))
@@ -5,12 +5,13 @@ import json
 import re
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import String, and_, case, cast, func, literal, or_, select, text
+from sqlalchemy import String, and_, case, cast, exists, func, literal, or_, select, text
 from sqlalchemy.exc import DBAPIError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased, defer, joinedload, selectinload, undefer
 from typing_extensions import TypedDict
 
 from src.config import settings
@@ -101,6 +102,36 @@ def owned_email(db: Session, user_id: int, email_id: int) -> EmailLog:
     return message
 
 
+def owned_email_and_account(
+    db: Session, user_id: int, email_id: int, account_id: int, *, with_attachments: bool = False
+) -> tuple[EmailLog, SMTPConfig]:
+    """Fetch a message and a sending account together in one roundtrip.
+
+    Reply and forward need both rows before composing anything, so fetching
+    them separately costs an extra roundtrip on every call. The combined query
+    cross-joins the two single-row lookups; on a miss it falls back to the
+    individual helpers so the caller still gets a precise 404. Forwarding also
+    reads the attachment rows, and for a single parent a joined load folds
+    them into the same roundtrip.
+    """
+    sending_account = aliased(SMTPConfig)
+    query = (
+        owned_email_query(db, user_id)
+        .add_entity(sending_account)
+        .join(sending_account, sending_account.id == account_id)
+        .filter(
+            EmailLog.id == email_id,
+            sending_account.owner_user_id == user_id,
+        )
+    )
+    if with_attachments:
+        query = query.options(joinedload(EmailLog.attachments))
+    row = query.first()
+    if row is not None:
+        return row[0], row[1]
+    return owned_email(db, user_id, email_id), owned_account(db, user_id, account_id)
+
+
 def mail_account_summary(db: Session, user: User) -> MailAccountSummary:
     """Return exact tenant-scoped mailbox inventory without search pagination."""
     rows = (
@@ -461,6 +492,17 @@ def _query_digest(values: dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+@lru_cache(maxsize=256)
+def _compile_user_pattern(pattern: str) -> re.Pattern:
+    """Compile a caller-supplied pattern once per process.
+
+    Paging through regex results re-submits the same pattern once per page;
+    compiling is pure in the pattern, so the cache amortises it. An invalid
+    pattern raises on every call, which is the behaviour the 400 path needs.
+    """
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+
 def _database_regex_pattern(pattern: str, dialect_name: str) -> str:
     """Translate portable word-boundary escapes to PostgreSQL ARE syntax."""
     if dialect_name != "postgresql":
@@ -486,6 +528,20 @@ def _database_regex_pattern(pattern: str, dialect_name: str) -> str:
     return "".join(translated)
 
 
+def _reject_inverted_date_range(date_from: datetime | None, date_to: datetime | None) -> None:
+    """Refuse a range that cannot match anything before querying for it."""
+    if not date_from or not date_to:
+        return
+    lower, upper = date_from, date_to
+    # A caller may mix naive and aware bounds; treat naive as UTC for the check.
+    if lower.tzinfo is None:
+        lower = lower.replace(tzinfo=timezone.utc)
+    if upper.tzinfo is None:
+        upper = upper.replace(tzinfo=timezone.utc)
+    if lower > upper:
+        raise HTTPException(status_code=400, detail="date_from is after date_to")
+
+
 def _apply_keyset(query, cursor_date: datetime | None, cursor_id: int):
     if cursor_date is None:
         return query.filter(
@@ -694,6 +750,7 @@ def select_message_ids(
     total separately is what lets a caller see that its limit truncated the work
     rather than silently doing part of it.
     """
+    _reject_inverted_date_range(date_from, date_to)
     q = owned_email_query(db, user.id).filter(EmailLog.deleted_at.is_(None))
     q = _apply_common_filters(
         q,
@@ -762,6 +819,7 @@ def search_mail(
         raise HTTPException(status_code=400, detail="Invalid deduplication mode")
     if match not in {"stemmed", "exact"}:
         raise HTTPException(status_code=400, detail="Invalid match mode")
+    _reject_inverted_date_range(date_from, date_to)
     if account_id is not None:
         owned_account(db, user.id, account_id)
     participant_terms = [
@@ -792,12 +850,18 @@ def search_mail(
     if query.strip():
         condition = match_condition(message_document(), query, match=match)
         if search_attachments:
-            attachment_ids = (
-                db.query(EmailAttachment.email_log_id)
-                .filter(match_condition(attachment_document(), query, match=match))
-                .subquery()
+            # A correlated EXISTS lets the planner probe per message and stop
+            # at the first matching attachment instead of materialising the
+            # whole matching-id set for an IN filter.
+            condition = or_(
+                condition,
+                exists().where(
+                    and_(
+                        EmailAttachment.email_log_id == EmailLog.id,
+                        match_condition(attachment_document(), query, match=match),
+                    )
+                ),
             )
-            condition = or_(condition, EmailLog.id.in_(select(attachment_ids)))
         q = q.filter(condition)
 
     flag_filters = {
@@ -808,9 +872,9 @@ def search_mail(
     flag_warning = _flag_state_warning(q, flag_filters)
     q = _apply_flag_filters(q, flag_filters)
 
-    raw_count = q.order_by(None).count()
     key_expression = _dedupe_key(deduplicate)
     if deduplicate == "none":
+        raw_count = q.order_by(None).count()
         result_query = q
         total_count = raw_count
     else:
@@ -838,12 +902,18 @@ def search_mail(
         representative_ids = select(ranked.c.message_id).where(
             ranked.c.position == 1
         )
-        total_count = (
-            db.query(func.count())
+        # Both counts fall out of the same ranked scan: every row is a raw
+        # match and the position-1 rows are the deduplicated groups, so one
+        # aggregate replaces the separate COUNT roundtrips.
+        raw_count, total_count = (
+            db.query(
+                func.count(),
+                func.coalesce(
+                    func.sum(case((ranked.c.position == 1, 1), else_=0)), 0
+                ),
+            )
             .select_from(ranked)
-            .filter(ranked.c.position == 1)
-            .scalar()
-            or 0
+            .one()
         )
         result_query = owned_email_query(db, user.id).filter(
             EmailLog.id.in_(representative_ids)
@@ -879,7 +949,16 @@ def search_mail(
 
     page_limit = min(max(1, limit), 100)
     messages = (
-        result_query.order_by(
+        # A search page serializes metadata only; leave the two body columns in
+        # the database instead of hauling every matching body across the wire.
+        # Attachments are serialized per row, so load them all in one extra
+        # IN-query instead of one lazy query per message.
+        result_query.options(
+            defer(EmailLog.body_plain),
+            defer(EmailLog.body_html),
+            selectinload(EmailLog.attachments),
+        )
+        .order_by(
             EmailLog.email_date.desc().nullslast(),
             EmailLog.id.desc(),
         )
@@ -1026,7 +1105,7 @@ def search_mail_regex(
     if not pattern or len(pattern) > settings.max_regex_pattern_length:
         raise HTTPException(status_code=400, detail="Regex pattern is empty or too long")
     try:
-        compiled = re.compile(pattern, flags=re.IGNORECASE)
+        compiled = _compile_user_pattern(pattern)
     except re.error as exc:
         raise HTTPException(status_code=400, detail=f"Invalid regex: {exc.msg}") from None
     selected_fields = list(dict.fromkeys((fields or []) + ([field] if field else [])))
@@ -1039,6 +1118,7 @@ def search_mail_regex(
         raise HTTPException(status_code=400, detail="Regex requires an account or date scope")
     if deduplicate not in {"none", "exact", "mirror"}:
         raise HTTPException(status_code=400, detail="Invalid deduplication mode")
+    _reject_inverted_date_range(date_from, date_to)
     if account_id is not None:
         owned_account(db, user.id, account_id)
 
@@ -1067,14 +1147,17 @@ def search_mail_regex(
         if name != "attachment"
     ]
     if "attachment" in selected_fields:
-        matching_attachment_ids = (
-            q.join(EmailAttachment)
-            .filter(EmailAttachment.text_content.op("~*")(database_pattern))
-            .with_entities(EmailLog.id)
-            .distinct()
-            .subquery()
+        # Correlated EXISTS instead of a DISTINCT id subquery: the planner can
+        # stop at the first matching attachment per message and skips the
+        # hash-distinct over the full match set.
+        conditions.append(
+            exists().where(
+                and_(
+                    EmailAttachment.email_log_id == EmailLog.id,
+                    EmailAttachment.text_content.op("~*")(database_pattern),
+                )
+            )
         )
-        conditions.append(EmailLog.id.in_(select(matching_attachment_ids)))
     q = q.filter(or_(*conditions))
 
     flag_filters = {
@@ -1153,8 +1236,25 @@ def search_mail_regex(
                 raise HTTPException(status_code=400, detail=str(exc)) from exc
             result_query = _apply_keyset(result_query, cursor_date, cursor_id)
         page_limit = min(max(1, limit), 50)
-        messages = (
-            result_query.order_by(
+        # Per-field match flags ride along with the page so Python only has to
+        # re-run the regex on fields the database already confirmed, instead of
+        # scanning every selected field (including multi-KB bodies) per row.
+        flag_fields = [name for name in selected_fields if name != "attachment"]
+        page_options = [selectinload(EmailLog.attachments)]
+        if "body" not in selected_fields:
+            # Bodies are only read to build body snippets; when the caller did
+            # not select the body field, keep both columns in the database.
+            page_options += [defer(EmailLog.body_plain), defer(EmailLog.body_html)]
+        page_query = result_query.options(*page_options)
+        if flag_fields:
+            page_query = page_query.add_columns(
+                *(
+                    columns[name].op("~*")(database_pattern).label(f"matched_{name}")
+                    for name in flag_fields
+                )
+            )
+        rows = (
+            page_query.order_by(
                 EmailLog.email_date.desc().nullslast(),
                 EmailLog.id.desc(),
             )
@@ -1164,8 +1264,18 @@ def search_mail_regex(
     except DBAPIError as exc:
         db.rollback()
         raise HTTPException(status_code=400, detail="Regex failed or exceeded its execution limit") from exc
-    has_more = len(messages) > page_limit
-    messages = messages[:page_limit]
+    has_more = len(rows) > page_limit
+    rows = rows[:page_limit]
+    if flag_fields:
+        messages = [row[0] for row in rows]
+        matched_flags = {
+            row[0].id: dict(zip(flag_fields, row[1:])) for row in rows
+        }
+    else:
+        # Attachment-only selection: with no added columns the query yields
+        # bare EmailLog entities rather than Row tuples.
+        messages = list(rows)
+        matched_flags = {message.id: {} for message in messages}
     message_ids = [message.id for message in messages]
     matches: dict[int, list[dict[str, Any]]] = {
         message_id: [] for message_id in message_ids
@@ -1180,6 +1290,8 @@ def search_mail_regex(
         for name in selected_fields:
             if name == "attachment":
                 continue
+            if not matched_flags[message.id].get(name):
+                continue
             value = values_by_field[name](message)
             for match in list(compiled.finditer(value))[:10]:
                 start = max(0, match.start() - 80)
@@ -1195,6 +1307,9 @@ def search_mail_regex(
     if "attachment" in selected_fields and message_ids:
         attachments = (
             db.query(EmailAttachment)
+            # text_content is deferred on the model; this pass reads it for
+            # every matching row, so fetch it with the rows.
+            .options(undefer(EmailAttachment.text_content))
             .filter(
                 EmailAttachment.email_log_id.in_(message_ids),
                 EmailAttachment.text_content.op("~*")(database_pattern),
@@ -1,15 +1,20 @@
 """Configuration resolver with global stronger negative logic."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Literal, Optional
 
 from src.config import settings
 from src.models.smtp_config import SMTPConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
-    """Resolved storage configuration for an account."""
+    """Resolved storage configuration for an account.
+
+    Frozen and slotted: instances are shared through the resolver memo, so
+    they must be immutable, and the per-attachment attribute reads become
+    offset loads instead of __dict__ lookups.
+    """
 
     store_text_only: bool
     max_attachment_size: int
@@ -19,6 +24,19 @@ class StorageConfig:
     extract_other_text: bool
 
 
+# Resolved configs memoized by their full inputs (global settings plus account
+# overrides). Keying by the values themselves rather than by account id means a
+# changed setting or override simply misses the cache -- nothing can serve
+# stale data, and update paths need no hook. Distinct override combinations
+# are few, so the dict stays small.
+_cache: dict[tuple, StorageConfig] = {}
+
+
+def invalidate_cache() -> None:
+    """Drop memoized configs (mainly a hygiene hook for tests/reloads)."""
+    _cache.clear()
+
+
 def resolve_storage_config(smtp_config: Optional[SMTPConfig] = None) -> StorageConfig:
     """
     Resolve effective storage configuration for an account.
@@ -38,14 +56,26 @@ def resolve_storage_config(smtp_config: Optional[SMTPConfig] = None) -> StorageC
     global_extract_other = settings.extract_other_text
 
     if smtp_config is None:
-        return StorageConfig(
-            store_text_only=global_store_text_only,
-            max_attachment_size=global_max_attachment_size,
-            extract_pdf_text=global_extract_pdf,
-            extract_docx_text=global_extract_docx,
-            extract_image_text=global_extract_image,
-            extract_other_text=global_extract_other,
+        key = (
+            global_store_text_only,
+            global_max_attachment_size,
+            global_extract_pdf,
+            global_extract_docx,
+            global_extract_image,
+            global_extract_other,
+            None,
         )
+        config = _cache.get(key)
+        if config is None:
+            config = _cache[key] = StorageConfig(
+                store_text_only=global_store_text_only,
+                max_attachment_size=global_max_attachment_size,
+                extract_pdf_text=global_extract_pdf,
+                extract_docx_text=global_extract_docx,
+                extract_image_text=global_extract_image,
+                extract_other_text=global_extract_other,
+            )
+        return config
 
     account_store_text_only = smtp_config.store_text_only_override
     account_max_size = smtp_config.max_attachment_size_override
@@ -54,14 +84,31 @@ def resolve_storage_config(smtp_config: Optional[SMTPConfig] = None) -> StorageC
     account_extract_image = smtp_config.extract_image_text_override
     account_extract_other = smtp_config.extract_other_text_override
 
-    return StorageConfig(
-        store_text_only=_resolve_boolean(global_store_text_only, account_store_text_only),
-        max_attachment_size=_resolve_max_value(global_max_attachment_size, account_max_size),
-        extract_pdf_text=_resolve_boolean(global_extract_pdf, account_extract_pdf),
-        extract_docx_text=_resolve_boolean(global_extract_docx, account_extract_docx),
-        extract_image_text=_resolve_boolean(global_extract_image, account_extract_image),
-        extract_other_text=_resolve_boolean(global_extract_other, account_extract_other),
+    key = (
+        global_store_text_only,
+        global_max_attachment_size,
+        global_extract_pdf,
+        global_extract_docx,
+        global_extract_image,
+        global_extract_other,
+        account_store_text_only,
+        account_max_size,
+        account_extract_pdf,
+        account_extract_docx,
+        account_extract_image,
+        account_extract_other,
     )
+    config = _cache.get(key)
+    if config is None:
+        config = _cache[key] = StorageConfig(
+            store_text_only=_resolve_boolean(global_store_text_only, account_store_text_only),
+            max_attachment_size=_resolve_max_value(global_max_attachment_size, account_max_size),
+            extract_pdf_text=_resolve_boolean(global_extract_pdf, account_extract_pdf),
+            extract_docx_text=_resolve_boolean(global_extract_docx, account_extract_docx),
+            extract_image_text=_resolve_boolean(global_extract_image, account_extract_image),
+            extract_other_text=_resolve_boolean(global_extract_other, account_extract_other),
+        )
+    return config
 
 
 def _resolve_boolean(global_val: bool, account_val: Optional[bool]) -> bool:
@@ -85,6 +132,23 @@ def _resolve_max_value(global_val: int, account_val: Optional[int]) -> int:
     return min(global_val, account_val)
 
 
+# MIME type -> StorageConfig attribute governing its extraction. Exact matches
+# resolve with one hash lookup; only image/* and text/* need a prefix scan.
+_EXACT_TYPE_ATTR = {
+    "application/pdf": "extract_pdf_text",
+    "application/msword": "extract_docx_text",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "extract_docx_text",
+    "application/json": "extract_other_text",
+    "application/xml": "extract_other_text",
+    "application/csv": "extract_other_text",
+    "application/rtf": "extract_other_text",
+}
+_PREFIX_TYPE_ATTR = (
+    ("image/", "extract_image_text"),
+    ("text/", "extract_other_text"),
+)
+
+
 def should_extract_text(config: StorageConfig, content_type: str) -> bool:
     """Check if text should be extracted for the given content type."""
     if content_type is None:
@@ -92,23 +156,28 @@ def should_extract_text(config: StorageConfig, content_type: str) -> bool:
 
     content_type_lower = content_type.lower()
 
-    if content_type_lower == "application/pdf":
-        return config.extract_pdf_text
-    if content_type_lower in (
-        "application/msword",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    ):
-        return config.extract_docx_text
-    if content_type_lower.startswith("image/"):
-        return config.extract_image_text
-    if content_type_lower.startswith("text/"):
-        return config.extract_other_text
-    if content_type_lower in (
-        "application/json",
-        "application/xml",
-        "application/csv",
-        "application/rtf",
-    ):
-        return config.extract_other_text
-
-    return False
+    attr = _EXACT_TYPE_ATTR.get(content_type_lower)
+    if attr is None:
+        for prefix, prefix_attr in _PREFIX_TYPE_ATTR:
+            if content_type_lower.startswith(prefix):
+                attr = prefix_attr
+                break
+        else:
+            return False
+    return getattr(config, attr)
+
+
+def should_store_attachment(
+    config: StorageConfig, content_type: Optional[str], size: int
+) -> Literal["skip", "binary", "text"]:
+    """One verdict for an attachment part, so callers branch exactly once.
+
+    - "skip": over the size limit; record metadata only, touch nothing else
+    - "text": an enabled extractor covers this type; decode and extract
+    - "binary": keep the metadata but do not run decoding or extraction
+    """
+    if size > config.max_attachment_size:
+        return "skip"
+    if should_extract_text(config, content_type):
+        return "text"
+    return "binary"
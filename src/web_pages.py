@@ -182,26 +182,31 @@ def html_page(content: str, status_code: int = 200) -> HTMLResponse:
     )
 
 
+# Both service pages are constant, so render the documents once at import.
+# Only the HTML string is cached -- each request still gets its own response
+# object, because middleware (SessionMiddleware in particular) mutates a
+# response's header list in place and a shared instance would leak one
+# request's headers into every later one.
+_GMAIL_CONNECTED_HTML = _document(
+    title="Gmail connected",
+    eyebrow="Connected",
+    heading="Gmail is ready",
+    body="Initial synchronization has started. You can close this tab and return to the conversation.",
+    tone="success",
+)
+_SERVICE_ONLINE_HTML = _document(
+    title="Service online",
+    eyebrow="Service online",
+    heading="AI Mail is running",
+    body="The authenticated mail connector is available and ready for MCP clients.",
+    tone="success",
+)
+
+
 def service_page(connected: str | None = None) -> HTMLResponse:
     if connected == "gmail":
-        return html_page(
-            _document(
-                title="Gmail connected",
-                eyebrow="Connected",
-                heading="Gmail is ready",
-                body="Initial synchronization has started. You can close this tab and return to the conversation.",
-                tone="success",
-            )
-        )
-    return html_page(
-        _document(
-            title="Service online",
-            eyebrow="Service online",
-            heading="AI Mail is running",
-            body="The authenticated mail connector is available and ready for MCP clients.",
-            tone="success",
-        )
-    )
+        return html_page(_GMAIL_CONNECTED_HTML)
+    return html_page(_SERVICE_ONLINE_HTML)
 
 
 def password_form_page(
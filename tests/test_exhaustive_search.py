@@ -1,6 +1,6 @@
 """Exhaustive search contracts: counts, cursors, participants, and threads."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from fastapi import HTTPException
@@ -197,3 +197,95 @@ def test_postgres_regex_word_boundaries_are_translated_without_touching_literals
     assert _database_regex_pattern(r"\bword\B", "postgresql") == r"\yword\Y"
     assert _database_regex_pattern(r"\\bword", "postgresql") == r"\\bword"
     assert _database_regex_pattern(r"\bword", "sqlite") == r"\bword"
+
+
+def test_inverted_date_range_is_rejected_before_querying(search_db):
+    owner = User(google_sub="range-owner", email="owner@example.com")
+    search_db.add(owner)
+    search_db.flush()
+
+    with pytest.raises(HTTPException) as inverted:
+        search_mail(
+            search_db,
+            owner,
+            date_from=datetime(2026, 7, 28),
+            date_to=datetime(2026, 7, 1),
+        )
+    assert inverted.value.status_code == 400
+
+    # Mixed naive and aware bounds must be compared, not crash the comparison.
+    aware = datetime(2026, 7, 28, tzinfo=timezone.utc)
+    with pytest.raises(HTTPException) as mixed:
+        search_mail(search_db, owner, date_from=aware, date_to=datetime(2026, 7, 1))
+    assert mixed.value.status_code == 400
+
+
+def test_regex_attachment_only_selection_returns_entity_rows(search_db, monkeypatch):
+    """Attachment-only regex selection adds no per-field match columns, so the
+    page query yields bare EmailLog rows that must not be unpacked as tuples."""
+    import re
+
+    from sqlalchemy import func
+    from sqlalchemy.sql.operators import ColumnOperators
+
+    from src.models.attachment import EmailAttachment
+    from src.services import mail_service
+
+    owner = User(google_sub="attach-owner", email="owner@example.com")
+    search_db.add(owner)
+    search_db.flush()
+    account = _account(owner.id, "First")
+    search_db.add(account)
+    search_db.flush()
+    message = _message(account.id, 1, "<attached@example.com>")
+    search_db.add(message)
+    search_db.flush()
+    search_db.add(
+        EmailAttachment(
+            email_log_id=message.id,
+            filename="report.pdf",
+            content_type="application/pdf",
+            part_index=0,
+            provider_attachment_id="0",
+            size=16,
+            text_content="quarterly totals",
+            extraction_state="complete",
+        )
+    )
+    search_db.commit()
+
+    # SQLite has neither the ~* operator nor SET LOCAL; route both through
+    # equivalents so the page-query row shape itself is exercised.
+    search_db.connection().connection.create_function(
+        "pg_regexp",
+        2,
+        lambda value, pattern: value is not None
+        and re.search(pattern, value, re.IGNORECASE) is not None,
+    )
+    original_op = ColumnOperators.op
+
+    def translated_op(self, opstring, **kwargs):
+        if opstring == "~*":
+            return lambda other: func.pg_regexp(self, other)
+        return original_op(self, opstring, **kwargs)
+
+    monkeypatch.setattr(ColumnOperators, "op", translated_op)
+    original_text = mail_service.text
+    monkeypatch.setattr(
+        mail_service,
+        "text",
+        lambda sql: original_text("SELECT 1" if sql.startswith("SET LOCAL") else sql),
+    )
+
+    result = mail_service.search_mail_regex(
+        search_db,
+        owner,
+        pattern="quarterly",
+        field="attachment",
+        account_id=account.id,
+    )
+
+    assert [item["id"] for item in result["items"]] == [message.id]
+    matches = result["items"][0]["matches"]
+    assert [match["field"] for match in matches] == ["attachment"]
+    assert matches[0]["match"] == "quarterly"
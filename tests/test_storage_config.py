@@ -2,11 +2,17 @@
 
 from unittest.mock import patch
 
+from src.storage_config.resolver import (
+    StorageConfig,
+    _resolve_boolean,
+    _resolve_max_value,
+    resolve_storage_config,
+    should_extract_text,
+)
+
 
 def test_resolve_storage_config_defaults():
     """Test default storage config resolution."""
-    from src.storage_config.resolver import resolve_storage_config
-
     with patch("src.storage_config.resolver.settings") as mock_settings:
         mock_settings.store_text_only = False
         mock_settings.max_attachment_size_text = 1000000
@@ -25,8 +31,6 @@ def test_resolve_storage_config_defaults():
 
 def test_resolve_storage_config_with_none_override():
     """Test storage config with None overrides (should use global)."""
-    from src.storage_config.resolver import resolve_storage_config
-
     class MockSMTPConfig:
         store_text_only_override = None
         max_attachment_size_override = None
@@ -52,8 +56,6 @@ def test_resolve_storage_config_with_none_override():
 
 def test_should_extract_text():
     """Test should_extract_text function."""
-    from src.storage_config.resolver import StorageConfig, should_extract_text
-
     config = StorageConfig(
         store_text_only=False,
         max_attachment_size=1000000,
@@ -71,8 +73,6 @@ def test_should_extract_text():
 
 def test_should_extract_text_disabled():
     """Test should_extract_text when extraction is disabled."""
-    from src.storage_config.resolver import StorageConfig, should_extract_text
-
     config = StorageConfig(
         store_text_only=False,
         max_attachment_size=1000000,
@@ -89,8 +89,6 @@ def test_should_extract_text_disabled():
 
 def test_resolve_boolean_global_false():
     """Test boolean resolution when global is False."""
-    from src.storage_config.resolver import _resolve_boolean
-
     # Global False should always return False
     assert _resolve_boolean(False, None) is False
     assert _resolve_boolean(False, True) is False
@@ -99,8 +97,6 @@ def test_resolve_boolean_global_false():
 
 def test_resolve_boolean_global_true():
     """Test boolean resolution when global is True."""
-    from src.storage_config.resolver import _resolve_boolean
-
     # Global True with no override should return True
     assert _resolve_boolean(True, None) is True
     # Global True with account True should return True
@@ -111,8 +107,6 @@ def test_resolve_boolean_global_true():
 
 def test_resolve_max_value():
     """Test max value resolution."""
-    from src.storage_config.resolver import _resolve_max_value
-
     # No override
     assert _resolve_max_value(1000, None) == 1000
     # With override (smaller wins)
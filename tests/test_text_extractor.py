@@ -2,28 +2,26 @@
 
 import pytest
 
+from src.config import settings
+from src.email import text_extractor
+from src.email.text_extractor import TextExtractor
+from src.storage_config.resolver import StorageConfig
+
 
 def test_text_extractor_initialization():
     """Test TextExtractor initialization."""
-    from src.email.text_extractor import TextExtractor
-
     extractor = TextExtractor()
     assert extractor is not None
 
 
-def test_extraction_pool_is_single_spawned_worker():
-    from src.email import text_extractor
-
-    assert text_extractor._EXTRACTION_POOL._max_workers == 1
+def test_extraction_pool_honors_worker_setting_and_spawns():
+    assert text_extractor._EXTRACTION_POOL._max_workers == max(1, settings.extraction_workers)
     assert text_extractor._EXTRACTION_POOL._mp_context.get_start_method() == "spawn"
 
 
 @pytest.mark.asyncio
 async def test_extract_plain_text():
     """Test extracting plain text."""
-    from src.email.text_extractor import TextExtractor
-    from src.storage_config.resolver import StorageConfig
-
     extractor = TextExtractor()
     config = StorageConfig(
         store_text_only=False,
@@ -43,9 +41,6 @@ async def test_extract_plain_text():
 @pytest.mark.asyncio
 async def test_extract_html():
     """Test extracting text from HTML."""
-    from src.email.text_extractor import TextExtractor
-    from src.storage_config.resolver import StorageConfig
-
     extractor = TextExtractor()
     config = StorageConfig(
         store_text_only=False,
@@ -65,9 +60,6 @@ async def test_extract_html():
 @pytest.mark.asyncio
 async def test_extract_unsupported_type():
     """Test extracting unsupported content type."""
-    from src.email.text_extractor import TextExtractor
-    from src.storage_config.resolver import StorageConfig
-
     extractor = TextExtractor()
     config = StorageConfig(
         store_text_only=False,
@@ -87,9 +79,6 @@ async def test_extract_unsupported_type():
 @pytest.mark.asyncio
 async def test_extract_with_disabled_config():
     """Test extraction is disabled via config."""
-    from src.email.text_extractor import TextExtractor
-    from src.storage_config.resolver import StorageConfig
-
     extractor = TextExtractor()
     config = StorageConfig(
         store_text_only=False,
@@ -108,8 +97,6 @@ async def test_extract_with_disabled_config():
 
 def test_extract_html_method():
     """Test _extract_html method directly."""
-    from src.email.text_extractor import TextExtractor
-
     extractor = TextExtractor()
 
     data = b"<html><head><title>Test</title></head><body><p>Content</p></body></html>"
@@ -121,8 +108,6 @@ def test_extract_html_method():
 
 def test_decode_utf8():
     """Test UTF-8 decoding."""
-    from src.email.text_extractor import TextExtractor
-
     extractor = TextExtractor()
 
     data = "Hello Wörld!".encode("utf-8")
@@ -133,8 +118,6 @@ def test_decode_utf8():
 
 def test_decode_utf8_with_invalid_chars():
     """Test UTF-8 decoding with invalid characters."""
-    from src.email.text_extractor import TextExtractor
-
     extractor = TextExtractor()
 
     data = b"Hello \xff\xfe World"